@@ -0,0 +1,212 @@
+"""
+Benchmarks for the Mesa building blocks the simulation relies on.
+
+Each case is timed at several sizes and the median runtime is written to a
+JSON file. If a baseline JSON file from an earlier run is given, cases that
+got slower than the allowed tolerance are reported and the script exits
+with status 1.
+
+Usage:
+    python mesa_performance_test.py
+    python mesa_performance_test.py --output bench.json --baseline old.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+import mesa
+from mesa import Agent, Model
+from mesa.datacollection import DataCollector
+from mesa.experimental.devs.simulator import DEVSimulator
+from mesa.space import MultiGrid, PropertyLayer
+from mesa.time import RandomActivation, RandomActivationByType
+
+SIZES = (10, 50, 100)  # Grid side length; the number of agents is size**2
+REPEATS = 5
+STEPS = 10
+TOLERANCE = 0.2  # Allowed slowdown relative to the baseline (20 %)
+
+
+class BenchAgent(Agent):
+    def __init__(self, unique_id, model):
+        super().__init__(unique_id, model)
+        self.budget = model.random.random()
+
+    def step(self):
+        self.budget += 1
+
+
+class BenchModel(Model):
+    def __init__(self, size, scheduler=RandomActivation):
+        super().__init__()
+        self.grid = MultiGrid(size, size, torus=True)
+        self.schedule = scheduler(self)
+        for i in range(size * size):
+            agent = BenchAgent(i, self)
+            self.schedule.add(agent)
+            self.grid.place_agent(agent, (i % size, i // size))
+
+
+# Benchmark cases: each takes the grid size and returns a callable to time
+
+def grid_placement(size):
+    model = Model()
+    agents = [BenchAgent(i, model) for i in range(size * size)]
+
+    def run():
+        grid = MultiGrid(size, size, torus=True)
+        for i, agent in enumerate(agents):
+            grid.place_agent(agent, (i % size, i // size))
+    return run
+
+
+def grid_moves(size):
+    model = BenchModel(size)
+    agents = list(model.schedule.agents)
+
+    def run():
+        for agent in agents:
+            x, y = agent.pos
+            model.grid.move_agent(agent, ((x + 1) % size, y))
+    return run
+
+
+def property_layer_ops(size):
+    layer = PropertyLayer("color", size, size, default_value=0, dtype=int)
+
+    def run():
+        layer.set_cells(1, condition=lambda v: v == 0)
+        layer.modify_cells(np.add, 2)
+        layer.select_cells(lambda v: v > 2, return_list=False)
+        layer.aggregate_property(np.sum)
+    return run
+
+
+def random_activation_step(size):
+    model = BenchModel(size)
+
+    def run():
+        for _ in range(STEPS):
+            model.schedule.step()
+    return run
+
+
+def random_activation_by_type_step(size):
+    model = BenchModel(size, scheduler=RandomActivationByType)
+
+    def run():
+        for _ in range(STEPS):
+            model.schedule.step()
+    return run
+
+
+def datacollector_collect(size):
+    model = BenchModel(size)
+    collector = DataCollector(
+        model_reporters={"agent_count": lambda m: m.schedule.get_agent_count()},
+        agent_reporters={"budget": "budget"},
+    )
+
+    def run():
+        for _ in range(STEPS):
+            collector.collect(model)
+    return run
+
+
+def devs_event_throughput(size):
+    n_events = size * size * STEPS
+
+    def run():
+        simulator = DEVSimulator()
+        simulator.setup(Model())
+        for i in range(n_events):
+            simulator.schedule_event_absolute(int, float(i % STEPS))
+        simulator.run_until(float(STEPS))
+    return run
+
+
+CASES = {
+    "grid_placement": grid_placement,
+    "grid_moves": grid_moves,
+    "property_layer_ops": property_layer_ops,
+    "random_activation_step": random_activation_step,
+    "random_activation_by_type_step": random_activation_by_type_step,
+    "datacollector_collect": datacollector_collect,
+    "devs_event_throughput": devs_event_throughput,
+}
+
+
+def time_case(make_case, size, repeats=REPEATS):
+    """Return the median runtime of a benchmark case in seconds."""
+    timecosts = []
+    for _ in range(repeats):
+        run = make_case(size)
+        s_time = perf_counter()
+        run()
+        timecosts.append(perf_counter() - s_time)
+    return float(np.median(timecosts))
+
+
+def run_benchmarks(sizes=SIZES, repeats=REPEATS, cases=None):
+    results = {}
+    for name, make_case in CASES.items():
+        if cases and name not in cases:
+            continue
+        for size in sizes:
+            key = f"{name}[{size}]"
+            results[key] = time_case(make_case, size, repeats)
+            print(f"{key:<42} {1e3 * results[key]:10.3f} ms")
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Return the cases that are slower than the baseline allows."""
+    regressions = {}
+    for key, runtime in results.items():
+        old = baseline.get(key)
+        if old and runtime > old * (1 + tolerance):
+            regressions[key] = (old, runtime)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--cases", nargs="+", choices=CASES)
+    args = parser.parse_args(argv)
+
+    np.random.seed(42)
+    results = run_benchmarks(args.sizes, args.repeats, args.cases)
+    with open(args.output, "w") as f:
+        json.dump({
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "mesa": mesa.__version__,
+            "numpy": np.__version__,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        for key, (old, new) in regressions.items():
+            print(f"REGRESSION {key}: {1e3 * old:.3f} ms -> {1e3 * new:.3f} ms")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Probe the NumPy/BLAS environment and recommend thread settings.
+
+Records the NumPy build configuration, BLAS/LAPACK vendor, thread related
+environment variables and CPU features, and times the linear algebra
+kernels of np_performance_test_1.py and np_performance_test_2.py at several
+thread counts. Each thread count runs in a fresh subprocess, as BLAS
+libraries read their thread settings only at import time.
+
+Usage:
+    python np_env_probe.py
+    python np_env_probe.py --threads 1 2 4 8 --size 2048 --output probe.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from time import perf_counter
+
+import numpy as np
+
+THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+SIZE = 1024
+
+
+def blas_info():
+    """Return the BLAS and LAPACK libraries NumPy was built against."""
+    try:
+        config = np.show_config(mode="dicts")
+    except TypeError:  # NumPy < 1.26 only prints the configuration
+        return {}
+    deps = config.get("Build Dependencies", {})
+    return {lib: {k: deps[lib].get(k) for k in ("name", "version", "openblas configuration")
+                  if k in deps[lib]}
+            for lib in ("blas", "lapack") if lib in deps}
+
+
+def cpu_features():
+    """Return the SIMD features NumPy detected at runtime."""
+    try:
+        from numpy.core._multiarray_umath import __cpu_features__
+    except ImportError:
+        return {}
+    return sorted(name for name, available in __cpu_features__.items() if available)
+
+
+def environment():
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "blas": blas_info(),
+        "cpu_features": cpu_features(),
+        "thread_env": {var: os.environ.get(var) for var in THREAD_VARS},
+    }
+
+
+# Kernels: each returns the mean runtime of one call in seconds
+# SOURCE: https://gist.github.com/markus-beuckelmann/8bc25531b11158431a5b09a45abd6276
+
+def _mean_time(fn, n):
+    t = perf_counter()
+    for _ in range(n):
+        fn()
+    return (perf_counter() - t) / n
+
+
+def kernel_dot(size):
+    A, B = np.random.random((size, size)), np.random.random((size, size))
+    return _mean_time(lambda: np.dot(A, B), 5)
+
+
+def kernel_vector_dot(size):
+    C, D = np.random.random((size * 128,)), np.random.random((size * 128,))
+    return _mean_time(lambda: np.dot(C, D), 1000)
+
+
+def kernel_svd(size):
+    E = np.random.random((size // 2, size // 4))
+    return _mean_time(lambda: np.linalg.svd(E, full_matrices=False), 3)
+
+
+def kernel_cholesky(size):
+    F = np.random.random((size // 2, size // 2))
+    F = np.dot(F, F.T) + size * np.eye(size // 2)
+    return _mean_time(lambda: np.linalg.cholesky(F), 3)
+
+
+def kernel_eig(size):
+    G = np.random.random((size // 2, size // 2))
+    return _mean_time(lambda: np.linalg.eig(G), 3)
+
+
+def kernel_small_svd(size):
+    # The many small decompositions of np_performance_test_1.py
+    a = np.random.uniform(size=(300, 300))
+    return _mean_time(lambda: np.linalg.svd(a), 20)
+
+
+KERNELS = {
+    "dot": kernel_dot,
+    "vector_dot": kernel_vector_dot,
+    "svd": kernel_svd,
+    "cholesky": kernel_cholesky,
+    "eig": kernel_eig,
+    "small_svd": kernel_small_svd,
+}
+
+
+def run_kernels(size=SIZE):
+    np.random.seed(0)
+    return {name: kernel(size) for name, kernel in KERNELS.items()}
+
+
+def run_kernels_with_threads(threads, size=SIZE):
+    """Run the kernels in a subprocess limited to the given thread count."""
+    env = dict(os.environ, **{var: str(threads) for var in THREAD_VARS})
+    out = subprocess.run(
+        [sys.executable, __file__, "--kernels-only", "--size", str(size)],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out)
+
+
+def recommend(timings):
+    """
+    Recommend thread counts from {threads: {kernel: seconds}}.
+
+    A single model run should use the thread count with the lowest total
+    runtime. Batch workers share the machine, so with cpu_count // threads
+    workers the best setting maximizes cpu_count / (threads * runtime).
+    """
+    totals = {threads: sum(result.values()) for threads, result in timings.items()}
+    single = min(totals, key=totals.get)
+    batch = max(totals, key=lambda t: 1 / (t * totals[t]))
+    return {"single_model": single, "batch_worker": batch}
+
+
+def probe(thread_counts, size=SIZE):
+    timings = {}
+    for threads in thread_counts:
+        timings[threads] = run_kernels_with_threads(threads, size)
+        total = sum(timings[threads].values())
+        print(f"{threads:>3} threads: " + "  ".join(
+            f"{name} {1e3 * t:.2f} ms" for name, t in timings[threads].items()
+        ) + f"  (total {1e3 * total:.2f} ms)")
+    return {
+        "environment": environment(),
+        "size": size,
+        "timings": timings,
+        "recommended_threads": recommend(timings),
+    }
+
+
+def _default_thread_counts():
+    counts, n = [], 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+")
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--output", help="write the report as JSON")
+    parser.add_argument("--kernels-only", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.kernels_only:
+        print(json.dumps(run_kernels(args.size)))
+        return
+
+    print(json.dumps(environment(), indent=2))
+    report = probe(args.threads or _default_thread_counts(), args.size)
+    rec = report["recommended_threads"]
+    print(f"\nRecommended OMP_NUM_THREADS: {rec['single_model']} for single-model runs, "
+          f"{rec['batch_worker']} for batch workers")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+import json
 import time
 import numpy as np
+from np_env_probe import environment
+
+print(json.dumps(environment(), indent=2))
+
 np.random.seed(42)
 a = np.random.uniform(size=(300, 300))
 runtimes = 10
@@ -3,6 +3,10 @@
 import numpy as np
 from time import time
 from datetime import datetime
+import json
+from np_env_probe import environment
+
+print(json.dumps(environment(), indent=2))
 
 start_time = datetime.now()
 